@@ -11,6 +11,7 @@ from .httpdate import (
     WEEKDAYS,
     httpdate_to_unixtime,
     is_valid_httpdate,
+    parse_many,
     unixtime_to_httpdate,
 )
 
@@ -22,5 +23,6 @@ __all__ = [
     "WEEKDAYS",
     "httpdate_to_unixtime",
     "is_valid_httpdate",
+    "parse_many",
     "unixtime_to_httpdate",
 ]
@@ -8,6 +8,7 @@ __all__ = (
     "httpdate_to_unixtime",
     "unixtime_to_httpdate",
     "is_valid_httpdate",
+    "parse_many",
     "MIN_YEAR",
     "MIN_UNIXTIME",
     "RFC9110",
@@ -15,11 +16,23 @@ __all__ = (
     "WEEKDAYS",
 )
 
-import calendar
+import functools
 import re
+import sys
 import time
 from datetime import datetime, timezone
-from typing import Dict, Match, Optional, Tuple
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Match,
+    NoReturn,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 
 from leapseconds import LEAP_SECONDS
 
@@ -29,12 +42,20 @@ MIN_YEAR: int = 1900
 # Jan 1st, 1900, 00:00:00  (RFC 9110 / RFC 5322 minimum)
 MIN_UNIXTIME: int = -2208988800
 
+# Dec 31st, 9999, 23:59:59. RFC 9110 only covers four-digit years, and this also
+# used to be the upper bound of `datetime.fromtimestamp()` on most platforms.
+_MAX_UNIXTIME: int = 253402300799
+
 # The regexes need not be bulletproof, as we're checking for semantic correctness
-# later. The vital part is `GMT` because `time.strptime()` isn't timezone aware and
-# the behaviour of %Z is platform-specific. (`datetime` is more timezone-aware but
-# it doesn't support leap seconds, and %Z has the same issue.) We drop the original
-# weekday when parsing so that `time.strptime()` can auto-calculate the weekday,
-# which we later use to check the semantic correctness of the original weekday.
+# later. The vital part is `GMT` because HTTP dates must always represent UTC and
+# timezone handling with %Z is platform-specific. We capture the original weekday
+# separately so that we can check its semantic correctness against the weekday
+# implied by the date itself.
+#
+# The `strptime` format strings are retained for API compatibility, but parsing is
+# done with direct integer extraction (see `_fields`): `time.strptime()` is
+# implemented in pure Python, takes a module-level lock, and compiles a regex of
+# its own, which made it the dominant cost of every parse.
 RFC9110: Dict[str, Dict[str, str]] = {
     "IMF-fixdate": {
         # Sun, 06 Nov 1994 08:49:37 GMT
@@ -85,111 +106,418 @@ WEEKDAYS: Dict[int, Tuple[str, str]] = {
     6: ("Sunday", "Sun"),
 }
 
+# Index-based lookups for formatting: `_WDAY_ABBR` is indexed by `tm_wday`
+# (0=Monday) and `_MONTH_ABBR` by month-1. Derived from the public dicts above.
+_WDAY_ABBR: Tuple[str, ...] = tuple(abbr for _, abbr in WEEKDAYS.values())
+_MONTH_ABBR: Tuple[str, ...] = tuple(MONTHS)
+
+# Days in each month for a non-leap year. February is adjusted for leap years in
+# `_validate`, which checks day-of-month bounds itself.
+_DAYS_IN_MONTH: Tuple[int, ...] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Weekday names indexed by Sakamoto's algorithm (see `_weekday`): 0=Sunday. The
+# public `WEEKDAYS` dict (0=Monday, matching `tm_wday`) is kept for API compat.
+_SAKAMOTO_T: Tuple[int, ...] = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+_WDAY_SHORT: Tuple[str, ...] = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+_WDAY_LONG: Tuple[str, ...] = (
+    "Sunday",
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+)
 
-def _normalize_for_strptime(fmt: str, matches: Match[str]) -> str:
-    if fmt == "rfc850-date":
-        # When `time.strptime()` parses a 2-digit year, the year is converted as per the
-        # POSIX and ISO C standards (which the `time` docs currently state means values
-        # 69-99 are mapped to 1969-1999 and values 0-68 are mapped to 2000-2068).
+# Compile the pattern once at import time. `re` caches compiled patterns
+# internally, but that cache is LRU-bounded and costs a dict lookup (plus hashing
+# the pattern string) on every call. IMF-fixdate and rfc850-date are parsed by
+# fixed-offset slicing instead; only asctime-date (with its variable-width,
+# space-padded day) still uses a regex. `RFC9110` stays as-is for the public API.
+_ASCTIME_RE: Pattern[str] = re.compile(RFC9110["asctime-date"]["regex"])
+
+
+def _is_leap_year(year: int) -> bool:
+    # Equivalent to the textbook `% 4 / % 100 / % 400` test: for multiples of 4,
+    # divisibility by 100 is divisibility by 25, and divisibility by 400 is
+    # divisibility by 16. The two `%` ops become cheap bit masks.
+    return year & 3 == 0 and (year % 25 != 0 or year & 15 == 0)
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    # The inverse of `_civil_from_days` (also Hinnant's public-domain algorithm):
+    # (year, month, day) to days since the Unix epoch in ~15 integer ops, with no
+    # datetime round-trip or allocation.
+    year -= month <= 2
+    era: int = year // 400
+    yoe: int = year - era * 400
+    doy: int = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    doe: int = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def _civil_from_days(days: int) -> Tuple[int, int, int]:
+    # Howard Hinnant's public-domain `civil_from_days` algorithm: converts days
+    # since the Unix epoch to (year, month, day) in ~10 integer ops, with no
+    # allocations and no platform-dependent range limits. Python's floor division
+    # already rounds toward negative infinity, so pre-1970 days need no special
+    # era handling.
+    z: int = days + 719468
+    era: int = z // 146097
+    doe: int = z - era * 146097
+    yoe: int = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy: int = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp: int = (5 * doy + 2) // 153
+    day: int = doy - (153 * mp + 2) // 5 + 1
+    month: int = mp + 3 if mp < 10 else mp - 9
+    return (yoe + era * 400 + (month <= 2), month, day)
+
+
+# Leap seconds only ever occur at 23:59:60 UTC on a handful of official dates.
+# `LEAP_SECONDS` holds the post-leap timestamps (midnight of the following day),
+# so step back one day and precompute the (year, month, day) set once. The check
+# then needs no timestamp at all: just the civil date, which the parsers already
+# have in hand.
+_LEAP_YMD: FrozenSet[Tuple[int, int, int]] = frozenset(
+    _civil_from_days(ts // 86400 - 1) for ts in LEAP_SECONDS
+)
 
-        # RFC 9110 instead says we should assume the year is from this century, unless
-        # that would make the date-time more than 50 years in the future; in that case
-        # use the previous century. A simple way to check this is to convert the %b
-        # month string to an int, create an int 6-tuple (yyyy, mm, dd, hh, mm, ss), and
-        # compare that with an int 6-tuple of the current date-time with year=year+50
 
-        # Since we're not converting into a Python date-time format to calculate this,
-        # we conveniently avoid having to handle invalid dates (such as Feb 29th in a
-        # non-leap year) until after we've decided which century to use.
+def _weekday(year: int, month: int, day: int) -> int:
+    # Sakamoto's algorithm: the weekday (0=Sunday) in a handful of integer ops,
+    # with no table of cumulative month lengths and no intermediate timestamp.
+    year -= month < 3
+    return (
+        year + year // 4 - year // 100 + year // 400 + _SAKAMOTO_T[month - 1] + day
+    ) % 7
+
+
+# The rfc850-date century heuristic compares against a pivot 50 years away, so a
+# "now" that is up to a minute stale is immaterial. Cache the broken-down now-tuple
+# with a 60-second TTL rather than paying for `datetime.now(timezone.utc)` (which
+# allocates two objects) on every rfc850 parse.
+_REAL_DATETIME = datetime
+_UTC = timezone.utc
+_now_tuple: Tuple[int, int, int, int, int, int] = (0, 0, 0, 0, 0, 0)
+# Lowercase because it's mutable state, not a constant (pyright strict would
+# otherwise report reportConstantRedefinition on reassignment).
+_now_expires: float = 0.0  # pylint: disable=invalid-name
+_NOW_TTL: float = 60.0
+
+
+def _utcnow() -> Tuple[int, int, int, int, int, int]:
+    global _now_tuple, _now_expires  # pylint: disable=global-statement
+
+    # If something has replaced the module-level `datetime` (eg, a test double),
+    # defer to it and skip the cache entirely.
+    if datetime is not _REAL_DATETIME:
+        now: datetime = datetime.now(_UTC)
+        return (now.year, now.month, now.day, now.hour, now.minute, now.second)
+
+    ts: float = time.time()
+    if ts >= _now_expires:
+        tm: time.struct_time = time.gmtime(ts)
+        _now_tuple = (
+            tm.tm_year,
+            tm.tm_mon,
+            tm.tm_mday,
+            tm.tm_hour,
+            tm.tm_min,
+            tm.tm_sec,
+        )
+        _now_expires = ts + _NOW_TTL
 
-        now: datetime = datetime.now(timezone.utc)
-        year: int = max(now.year, MIN_YEAR)
+    return _now_tuple
 
-        lm_dmy: list[str] = matches.group(2).split("-")
-        lm_dd: int = int(lm_dmy[0])
-        lm_month: str = lm_dmy[1]
-        lm_yy: str = lm_dmy[2]
 
-        if lm_month not in MONTHS:
-            raise ValueError
+def _rfc850_year(yy: int, mdhms: Tuple[int, int, int, int, int]) -> int:
+    # RFC 9110 says we should assume a 2-digit year is from this century, unless that
+    # would make the date-time more than 50 years in the future; in that case use the
+    # previous century. A simple way to check this is to create an int 6-tuple
+    # (yyyy, mm, dd, hh, mm, ss) and compare that with an int 6-tuple of the current
+    # date-time with year=year+50. `mdhms` is the already-parsed
+    # (month, day, hour, minute, second) fields — everything except the year.
 
-        this_c: str = str(year // 100)
-        last_c: str = str(int(this_c) - 1)
+    # Since we're working with plain ints, we conveniently avoid having to handle
+    # invalid dates (such as Feb 29th in a non-leap year) until after we've decided
+    # which century to use.
+    now: Tuple[int, int, int, int, int, int] = _utcnow()
+    year: int = max(now[0], MIN_YEAR)
 
-        lm_tuple: Tuple[int, int, int, int, int, int] = (
-            int(f"{this_c}{lm_yy}"),
-            MONTHS[lm_month],
-            lm_dd,
-            *[int(x) for x in matches.group(3).split(":")],
-        )
+    # `century + yy` is the candidate year in the current century; a century back is
+    # a single subtraction (no string concatenation and reparsing needed).
+    candidate: int = year // 100 * 100 + yy
 
-        future_tuple: Tuple[int, int, int, int, int, int] = (
-            year + 50,
-            now.month,
-            now.day,
-            now.hour,
-            now.minute,
-            now.second,
-        )
+    lm_tuple: Tuple[int, int, int, int, int, int] = (candidate, *mdhms)
 
-        yyyy: str = (
-            f"{last_c}{lm_yy}" if lm_tuple > future_tuple else f"{this_c}{lm_yy}"
-        )
-        return f"{lm_dd:02}-{MONTHS[lm_month]:02}-{yyyy} {matches.group(3)} GMT"
-
-    if fmt == "asctime-date":
-        month: str = matches.group(2)
-        if month not in MONTHS:
-            raise ValueError
-        return f"{MONTHS[month]:02} {matches.group(3).strip()}"
-
-    # IMF-fixdate
-    month: str = matches.group(3)
-    if month not in MONTHS:
-        raise ValueError
-    return f"{matches.group(2)} {MONTHS[month]:02} {matches.group(4)}"
-
-
-def _string_to_unixtime(fmt: str, httpdate: str, wday: str) -> int:
-    # `time.struct_time` is a suitable intermediate type before converting to a Unix
-    # timestamp: it supports leap seconds, it raises ValueError for (most) semantically
-    # incorrect date-time values (we do more validation below), and it doesn't matter
-    # that it isn't timezone aware because Last-Modified is always UTC.
-    try:
-        struct_time: time.struct_time = time.strptime(
-            httpdate,
-            RFC9110[fmt]["strptime"],
-        )
-    except ValueError:
-        raise ValueError("Invalid HTTP-date") from None
+    future_tuple: Tuple[int, int, int, int, int, int] = (
+        year + 50,
+        now[1],
+        now[2],
+        now[3],
+        now[4],
+        now[5],
+    )
 
-    expected_wday: str = WEEKDAYS[struct_time.tm_wday][0 if fmt == "rfc850-date" else 1]
-    if (
-        # RFC 5322, Section 3.3: "day-of-week MUST be the day implied by the date".
-        wday != expected_wday
-        # `time.strptime()` accepts `61` seconds for historical reasons related to an
-        # erroneous notion of "double leap seconds" in earlier versions of the POSIX
-        # standard. `61` isn't accepted by either RFC 9110 or the `calendar` module.
-        or struct_time.tm_sec > 60
+    return candidate - 100 if lm_tuple > future_tuple else candidate
+
+
+# (year, month, day, hour, minute, second) as plain ints.
+_Fields = Tuple[int, int, int, int, int, int]
+
+
+def _validate(fields: _Fields, wday: str, wday_names: Tuple[str, ...]) -> bool:
+    year, month, day, hh, mm, ss = fields
+
+    # Semantic validation that `time.strptime()` used to do for us. Note that `60`
+    # seconds is allowed here (a potential leap second, checked during conversion),
+    # and that `calendar.timegm()` doesn't validate its input at all.
+    max_day: int = _DAYS_IN_MONTH[month - 1] + (
+        1 if month == 2 and _is_leap_year(year) else 0
+    )
+    return (
+        1 <= day <= max_day
+        and hh <= 23
+        and mm <= 59
+        and ss <= 60
         # See comments for MIN_YEAR.
-        or struct_time.tm_year < MIN_YEAR
-    ):
-        raise ValueError("Invalid HTTP-date")
+        and year >= MIN_YEAR
+        # RFC 5322, Section 3.3: "day-of-week MUST be the day implied by the date".
+        and wday == wday_names[_weekday(year, month, day)]
+    )
 
-    # Any `time.struct_time` object that `time.strptime()` produces (from the format
-    # strings we use) should be parseable by `calendar.timegm()`. But just in case,
-    # we'll wrap in a try/except.
+
+def _convert(fields: _Fields) -> int:
+    year, month, day, hh, mm, ss = fields
+
+    # Any 6-tuple that passes `_validate` should be convertible. But just in case,
+    # we'll wrap in a try/except. Note that a leap second (ss == 60) naturally
+    # rolls the timestamp over into the next day, exactly as timegm() did.
     try:
-        timestamp: int = calendar.timegm(struct_time)
+        timestamp: int = (
+            _days_from_civil(year, month, day) * 86400 + hh * 3600 + mm * 60 + ss
+        )
     except (OverflowError, ValueError):
         raise ValueError("Out of range") from None
 
-    if struct_time.tm_sec == 60 and timestamp not in LEAP_SECONDS:
+    # Leap seconds can only be 23:59:60; the hh/mm guard keeps this exactly as
+    # strict as the old timestamp-membership check.
+    if ss == 60 and (hh != 23 or mm != 59 or (year, month, day) not in _LEAP_YMD):
         raise ValueError("Invalid leap second")
 
     return timestamp
 
 
+def _fields_imf(
+    httpdate: str,
+    *,
+    # Bound at definition time: LOAD_FAST instead of LOAD_GLOBAL + LOAD_ATTR on
+    # every parse.
+    _month_get: Callable[[str], Optional[int]] = MONTHS.get,
+) -> Optional[_Fields]:
+    # IMF-fixdate is a fully fixed layout ("Sun, 06 Nov 1994 08:49:37 GMT"), so
+    # every field sits at a known offset. Checking the delimiter positions and
+    # slicing directly skips the regex engine entirely on the dominant wire format.
+    # The caller guarantees 29 ASCII characters with a comma at index 3.
+    if (
+        httpdate[4],
+        httpdate[7],
+        httpdate[11],
+        httpdate[16],
+        httpdate[19],
+        httpdate[22],
+        httpdate[25:],
+    ) != (" ", " ", " ", " ", ":", ":", " GMT"):
+        return None
+
+    day_s: str = httpdate[5:7]
+    year_s: str = httpdate[12:16]
+    hh_s: str = httpdate[17:19]
+    mm_s: str = httpdate[20:22]
+    ss_s: str = httpdate[23:25]
+    # One isdigit() call over the concatenated digit fields; the string is known
+    # to be ASCII, so this matches [0-9] exactly.
+    if not (day_s + year_s + hh_s + mm_s + ss_s).isdigit():
+        return None
+
+    month: Optional[int] = _month_get(httpdate[8:11])
+    if month is None:
+        return None
+
+    fields: _Fields = (
+        int(year_s),
+        month,
+        int(day_s),
+        int(hh_s),
+        int(mm_s),
+        int(ss_s),
+    )
+    return fields if _validate(fields, httpdate[:3], _WDAY_SHORT) else None
+
+
+def _fields_rfc850(
+    httpdate: str,
+    comma: int,
+    *,
+    # Bound at definition time: LOAD_FAST instead of LOAD_GLOBAL + LOAD_ATTR on
+    # every parse.
+    _month_get: Callable[[str], Optional[int]] = MONTHS.get,
+) -> Optional[_Fields]:
+    # Only the weekday name varies in length; once the comma is located, everything
+    # after it is a fixed layout (" 06-Nov-94 08:49:37 GMT"), so slice by constant
+    # offsets like the IMF-fixdate parser does. The caller guarantees the input is
+    # ASCII with exactly 22 characters after "<weekday>, ".
+    tail: str = httpdate[comma + 2 :]
+    if (
+        httpdate[comma + 1],
+        tail[2],
+        tail[6],
+        tail[9],
+        tail[12],
+        tail[15],
+        tail[18:],
+    ) != (" ", "-", "-", " ", ":", ":", " GMT"):
+        return None
+
+    day_s: str = tail[:2]
+    yy_s: str = tail[7:9]
+    hh_s: str = tail[10:12]
+    mm_s: str = tail[13:15]
+    ss_s: str = tail[16:18]
+    if not (day_s + yy_s + hh_s + mm_s + ss_s).isdigit():
+        return None
+
+    month: Optional[int] = _month_get(tail[3:6])
+    if month is None:
+        return None
+
+    day: int = int(day_s)
+    hh: int = int(hh_s)
+    mm: int = int(mm_s)
+    ss: int = int(ss_s)
+    year: int = _rfc850_year(int(yy_s), (month, day, hh, mm, ss))
+    fields: _Fields = (year, month, day, hh, mm, ss)
+    # An implausible weekday prefix (wrong name, wrong case, embedded spaces)
+    # simply fails the weekday-consistency comparison here.
+    return fields if _validate(fields, httpdate[:comma], _WDAY_LONG) else None
+
+
+def _fields_asctime(matches: Match[str]) -> Optional[_Fields]:
+    # The fourth group is the day (nested inside the remainder group).
+    wday, month_s, remainder, day_s = matches.groups()
+    month: Optional[int] = MONTHS.get(month_s)
+    if month is None:
+        return None
+    _, time_s, year_s = remainder.split()
+    hh, mm, ss = (int(x) for x in time_s.split(":"))
+    fields: _Fields = (int(year_s), month, int(day_s), hh, mm, ss)
+    return fields if _validate(fields, wday, _WDAY_SHORT) else None
+
+
+def _fields_obsolete(
+    httpdate: str,
+    n: int,
+    *,
+    # Bound at definition time: LOAD_FAST instead of LOAD_GLOBAL + LOAD_ATTR on
+    # every parse. (`_days_from_civil` and `datetime` are deliberately left as
+    # module-global lookups so they stay patchable.)
+    _asctime_match: Callable[[str], Optional[Match[str]]] = _ASCTIME_RE.match,
+) -> Optional[_Fields]:
+    # The two obsolete formats are distinguishable by the first comma: asctime-date
+    # has none, rfc850-date has one after its variable-length weekday name.
+    # Obviously-invalid input — common in hostile HTTP traffic — is rejected by
+    # length before any further work is done.
+    comma: int = httpdate.find(",")
+    if comma == -1:
+        if n != 24:
+            return None
+        matches: Optional[Match[str]] = _asctime_match(httpdate)
+        return _fields_asctime(matches) if matches else None
+
+    # "<weekday>, " followed by a fixed 22-character tail; the shortest weekday
+    # name is "Monday".
+    if comma >= 6 and n == comma + 24:
+        return _fields_rfc850(httpdate, comma)
+
+    return None
+
+
+def _fields(httpdate: str) -> Optional[_Fields]:
+    # HTTP dates are ASCII by definition (RFC 9110 names are case-sensitive
+    # English); rejecting non-ASCII here also lets the fixed-offset parser use a
+    # plain isdigit() check for [0-9].
+    if not httpdate.isascii():
+        return None
+
+    # Nearly all traffic on the wire is IMF-fixdate (RFC 9110 only permits sending
+    # that form), so test its exact shape first — one length compare and one
+    # character compare — and keep the obsolete formats on a separate slow lane.
+    # No other format is 29 characters with a comma at index 3 (rfc850-date is at
+    # least 30, and its shortest weekday would put the comma at index 6).
+    n: int = len(httpdate)
+    if n == 29 and httpdate[3] == ",":
+        return _fields_imf(httpdate)
+
+    return _fields_obsolete(httpdate, n)
+
+
+# Raising inline would embed the f-string construction bytecode in the callers'
+# success branches; `NoReturn` helpers keep those branches straight-line (and let
+# type-checkers see that control doesn't come back).
+def _invalid(httpdate: str) -> NoReturn:
+    msg = f"Invalid HTTP-date: '{httpdate}'"
+    raise ValueError(msg)
+
+
+def _out_of_range(unixtime: int) -> NoReturn:
+    msg = f"'{unixtime}' is out of range"
+    raise ValueError(msg)
+
+
+def _parse(httpdate: str) -> int:
+    # Malformed input — common in hostile HTTP traffic — is signalled by a `None`
+    # sentinel rather than an exception, so the rejection path costs no exception
+    # construction except in the public function that owns the error contract.
+    # `_convert` still raises, but only on its rare failure modes.
+    fields: Optional[_Fields] = _fields(httpdate)
+    if fields is None:
+        _invalid(httpdate)
+
+    try:
+        unixtime: int = _convert(fields)
+    except ValueError as exc:
+        raise ValueError(f"{exc}: '{httpdate}'") from None
+
+    return unixtime
+
+
+def _is_valid(httpdate: str) -> bool:
+    # Validation never needs the timestamp: everything except the leap-second
+    # check is covered by field extraction and `_validate`, and the leap-second
+    # check is a set lookup on the civil date.
+    fields: Optional[_Fields] = _fields(httpdate)
+    if fields is None:
+        return False
+
+    if fields[5] == 60:
+        return (
+            fields[3] == 23
+            and fields[4] == 59
+            and (fields[0], fields[1], fields[2]) in _LEAP_YMD
+        )
+
+    return True
+
+
+# HTTP date headers repeat heavily in practice (eg, `Last-Modified` on hot static
+# assets, or identical `If-Modified-Since` values across many requests), so memoize
+# successful parses. `functools.lru_cache` doesn't cache raised exceptions, so
+# invalid inputs can't poison the cache (they just reparse). 4096 entries is
+# ~0.5 MB at typical header sizes — enough for a large working set of distinct
+# assets while staying bounded.
+_parse_cached = functools.lru_cache(maxsize=4096)(_parse)
+
+
 def httpdate_to_unixtime(httpdate: str) -> int:
     """Parse an HTTP date (eg, `Last-Modified`) into a Unix timestamp.
 
@@ -240,23 +568,54 @@ def httpdate_to_unixtime(httpdate: str) -> int:
         msg = f"'{type(httpdate)}' object cannot be interpreted as a string"
         raise TypeError(msg)
 
-    for key, fields in RFC9110.items():
-        matches: Optional[Match[str]] = re.match(fields["regex"], httpdate)
-        if matches:
-            try:
-                _httpdate: str = _normalize_for_strptime(key, matches)
-            except (OSError, ValueError):
-                break
+    # An rfc850-date carries a two-digit year, so its result depends on the current
+    # clock (see `_rfc850_year`). Only rfc850-date has a comma after a weekday longer
+    # than three characters; skip the cache for those so stale results can't be
+    # served across a century rollover.
+    comma: int = httpdate.find(",")
+    if comma not in (3, -1):
+        return _parse(httpdate)
 
-            try:
-                unixtime: int = _string_to_unixtime(key, _httpdate, matches.group(1))
-            except ValueError as exc:
-                raise ValueError(f"{exc}: '{httpdate}'") from None
+    return _parse_cached(httpdate)
 
-            return unixtime
 
-    msg = f"Invalid HTTP-date: '{httpdate}'"
-    raise ValueError(msg)
+# Servers tend to format a small set of timestamps over and over (eg, a `Date`
+# header for the current second plus a `Last-Modified` a second or two behind,
+# across concurrent responses), so keep the four most recent conversions. The
+# cache is read and replaced as one tuple, so the GIL makes this safe without a
+# lock, and a linear scan of four entries beats a dict at this size.
+_format_cache: Tuple[Tuple[int, str], ...] = ()
+
+
+def _format(unixtime: int) -> str:
+    global _format_cache  # pylint: disable=global-statement
+
+    cache: Tuple[Tuple[int, str], ...] = _format_cache
+    for ts, cached in cache:
+        if ts == unixtime:
+            return cached
+
+    if unixtime < MIN_UNIXTIME or unixtime > _MAX_UNIXTIME:
+        _out_of_range(unixtime)
+
+    days, secs = divmod(unixtime, 86400)
+    year, month, day = _civil_from_days(days)
+    hh, rem = divmod(secs, 3600)
+    mm, ss = divmod(rem, 60)
+    wday: int = (days + 3) % 7  # Day 0 (1970-01-01) was a Thursday; 0=Monday.
+
+    # IMF-fixdate format. `strftime()` would load locale machinery and walk the
+    # format string on every call; for a fixed layout with locale-independent names
+    # an f-string over our own lookup tables is several times faster.
+    # Interning means repeat outputs (after a cache eviction, or from concurrent
+    # callers) share one string object, and downstream equality checks on the
+    # header value short-circuit on identity.
+    httpdate: str = sys.intern(
+        f"{_WDAY_ABBR[wday]}, {day:02d} {_MONTH_ABBR[month - 1]} "
+        f"{year:04d} {hh:02d}:{mm:02d}:{ss:02d} GMT"
+    )
+    _format_cache = ((unixtime, httpdate), *cache[:3])
+    return httpdate
 
 
 def unixtime_to_httpdate(unixtime: int) -> str:
@@ -274,33 +633,63 @@ def unixtime_to_httpdate(unixtime: int) -> str:
         unixtime (int): A Unix timestamp.
 
     Returns:
-        str: A valid IMF-fixdate header. It will return None if the input is
-            less than MIN_UNIXTIME, or if the input is outside the range supported by
-            the operating system.
+        str: A valid IMF-fixdate header.
 
     Raises:
         TypeError: If unixtime is not of type `int`.
-        ValueError: If unixtime represents a year before 1900, or is outside the
-            range supported by the operating system.
+        ValueError: If unixtime represents a year before 1900 or after 9999.
     """
     if not isinstance(unixtime, int):  # type: ignore
         msg: str = f"'{type(unixtime)}' object cannot be interpreted as an integer"
         raise TypeError(msg)
 
-    if unixtime < MIN_UNIXTIME:
-        msg = f"'{unixtime}' is out of range"
-        raise ValueError(msg)
+    return _format(unixtime)
 
-    try:
-        date: datetime = datetime.fromtimestamp(unixtime, tz=timezone.utc)
-    except (OSError, OverflowError, ValueError):
-        # The maximum unixtime that can be passed to `datetime.fromtimestamp()` varies
-        # by platform. On Linux, the max year is 9999, but on Windows it's around 3000.
-        msg = f"'{unixtime}' is out of range"
-        raise ValueError(msg) from None
 
-    # IMF-fixdate format.
-    return date.strftime("%a, %d %b %Y %H:%M:%S GMT")
+def parse_many(httpdates: Sequence[str]) -> List[Optional[int]]:
+    """Parse a sequence of HTTP dates into Unix timestamps.
+
+    This is intended for batch workloads (eg, parsing `Last-Modified` entries out
+    of access logs), where per-call overhead matters and a single malformed entry
+    shouldn't abort the batch. Invalid entries therefore yield None rather than
+    raising ValueError.
+
+    See docstring for httpdate_to_unixtime() for more information on RFC 9110
+    criteria.
+
+    Args:
+        httpdates (Sequence[str]): HTTP date fields (eg, `Last-Modified` values).
+
+    Returns:
+        List[Optional[int]]: A Unix timestamp for each input, in order, with None
+            for any input that isn't a valid HTTP date.
+
+    Raises:
+        TypeError: If any input is not of type `str`.
+    """
+    results: List[Optional[int]] = []
+    # Hoist the per-iteration lookups out of the loop; for log-sized batches the
+    # method/global lookups are a measurable share of the per-row cost.
+    append: Callable[[Optional[int]], None] = results.append
+    fields_of: Callable[[str], Optional[_Fields]] = _fields
+    convert: Callable[[_Fields], int] = _convert
+
+    for httpdate in httpdates:
+        if not isinstance(httpdate, str):  # type: ignore
+            msg = f"'{type(httpdate)}' object cannot be interpreted as a string"
+            raise TypeError(msg)
+
+        fields: Optional[_Fields] = fields_of(httpdate)
+        if fields is None:
+            append(None)
+            continue
+
+        try:
+            append(convert(fields))
+        except ValueError:
+            append(None)
+
+    return results
 
 
 def is_valid_httpdate(httpdate: str) -> bool:
@@ -317,9 +706,8 @@ def is_valid_httpdate(httpdate: str) -> bool:
     Raises:
         TypeError: If the input is not of type `str`.
     """
-    try:
-        httpdate_to_unixtime(httpdate)
-    except ValueError:
-        return False
+    if not isinstance(httpdate, str):  # type: ignore
+        msg = f"'{type(httpdate)}' object cannot be interpreted as a string"
+        raise TypeError(msg)
 
-    return True
+    return _is_valid(httpdate)
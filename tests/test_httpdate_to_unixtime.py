@@ -26,6 +26,13 @@ def test_type_str():
         httpdate_to_unixtime("")
 
 
+def test_non_ascii():
+    # Non-ASCII digits (here U+0661, ARABIC-INDIC DIGIT ONE) are rejected outright:
+    # RFC 9110 dates are ASCII by definition.
+    with pytest.raises(ValueError, match="Invalid HTTP-date:"):
+        httpdate_to_unixtime("Sun, 06 Nov ١994 08:49:37 GMT")
+
+
 #
 # IMF-fixdate
 
@@ -71,8 +78,8 @@ def test_imffixdate_bad_leap_second():
         httpdate_to_unixtime("Thu, 31 Dec 2015 23:59:60 GMT")
 
 
-def test_timegm_exception():
-    with patch("calendar.timegm", side_effect=ValueError):
+def test_conversion_exception():
+    with patch("httpdate.httpdate._days_from_civil", side_effect=ValueError):
         with pytest.raises(ValueError, match="Out of range:"):
             httpdate_to_unixtime("Fri, 31 Dec 9999 23:59:60 GMT")
 
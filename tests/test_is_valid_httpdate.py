@@ -47,3 +47,21 @@ def test_good(value):
 )
 def test_bad(value):
     assert not is_valid_httpdate(value)
+
+
+def test_good_leap_second():
+    assert is_valid_httpdate("Sat, 31 Dec 2016 23:59:60 GMT")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # not an official leap-second date
+        ("Thu, 31 Dec 2015 23:59:60 GMT"),
+        # leap seconds only occur at 23:59:60
+        ("Sat, 31 Dec 2016 12:00:60 GMT"),
+        ("Sat, 31 Dec 2016 23:00:60 GMT"),
+    ],
+)
+def test_bad_leap_second(value):
+    assert not is_valid_httpdate(value)
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: Copyright © 2023 Jamie Nguyen <j@jamielinux.com>
+# SPDX-License-Identifier: MIT
+
+import pytest
+from httpdate import parse_many
+
+
+def test_empty():
+    assert parse_many([]) == []
+
+
+def test_type_none_element():
+    with pytest.raises(TypeError):
+        parse_many([None])  # type: ignore
+
+
+def test_type_int_element():
+    with pytest.raises(TypeError):
+        parse_many(["Sun, 06 Nov 1994 08:49:37 GMT", 0])  # type: ignore
+
+
+def test_mixed_formats():
+    assert parse_many(
+        [
+            # IMF-fixdate
+            "Sun, 06 Nov 1994 08:49:37 GMT",
+            # rfc850-date
+            "Sunday, 06-Nov-94 08:49:37 GMT",
+            # asctime-date
+            "Sun Nov  6 08:49:37 1994",
+        ]
+    ) == [784111777, 784111777, 784111777]
+
+
+def test_invalid_entries_yield_none():
+    assert parse_many(
+        [
+            "Sun, 06 Nov 1994 08:49:37 GMT",
+            "Snn, 06 Nov 1994 08:49:37 GMT",
+            "Thu, 31 Dec 2015 23:59:60 GMT",
+            "",
+        ]
+    ) == [784111777, None, None, None]